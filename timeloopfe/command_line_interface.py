@@ -1,10 +1,14 @@
 import argparse
 import glob
+import mmap
 import os
 import re
 from typing import List
 
 SUPPORTED_VERSIONS = ["0.3", "0.4"]
+VERSION_RE = re.compile(rb"version:[\s'\"]*(\d+\.\d+)")
+DUMPED_MARKER = b"dumped_by_timeloop_front_end"
+PARSED_INPUT_NAME = "parsed-processed-input.yaml"
 
 
 def parse_args() -> argparse.Namespace:
@@ -44,19 +48,35 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def get_version(input_files: List[str]) -> object:
-    versions = set()
+def expand_input_files(input_files: List[str]) -> List[str]:
+    expanded, seen = [], set()
     for file in input_files:
-        found = glob.glob(file)
+        if any(c in file for c in "*?["):
+            found = glob.glob(file)
+        else:  # Literal path. Same result as glob.glob, without the pattern
+            found = [file] if os.path.lexists(file) else []
         if not found:
             raise FileNotFoundError(f"File {file} not found")
-        for file in glob.glob(file):
-            with open(file, "r") as f:
-                content = f.read()
-                match = re.search(r"version:[\s'\"]*(\d+\.\d+)", content)
+        for file in found:
+            # Overlapping patterns may match the same file; only list it once
+            if file not in seen:
+                seen.add(file)
+                expanded.append(file)
+    return expanded
+
+
+def get_version(input_files: List[str]) -> object:
+    versions = set()
+    for file in input_files:
+        with open(file, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                continue  # mmap can't map empty files, and there's nothing to find
+            # Scan the mapped bytes so large inputs aren't decoded into memory
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                match = VERSION_RE.search(content)
                 if match:
-                    versions.add(match.group(1))
-                if re.search(r"dumped_by_timeloop_front_end", content):
+                    versions.add(match.group(1).decode())
+                if content.find(DUMPED_MARKER) != -1:
                     return None
 
     if not versions:
@@ -89,7 +109,9 @@ def get_version(input_files: List[str]) -> object:
     return tl
 
 
-def call_no_parse(apps: List[str], args: argparse.Namespace, tl: object):
+def call_no_parse(
+    apps: List[str], args: argparse.Namespace, tl: object, input_files: List[str]
+):
     print(
         "Found parsed-processed-input.yaml in input files. "
         "Running Timeloop without parsing or processing steps. "
@@ -107,19 +129,15 @@ def call_no_parse(apps: List[str], args: argparse.Namespace, tl: object):
             app = "accelergy -v"
         extra_args = ["-l"] if args.list_components else []
         tl.backend_calls._call(
-            app, args.input_files, output_dir=args.output_dir, extra_args=extra_args
+            app, input_files, output_dir=args.output_dir, extra_args=extra_args
         )
 
 
 def get_jinja_parse_data(args: argparse.Namespace) -> dict:
     jinja_parse_data = {}
     for data in args.jinja_parse_data or []:
-        if "=" not in data:
-            raise ValueError(
-                f"Invalid jinja parse data: {data}. Must be in the form 'key=value'"
-            )
-        key, value = data.split("=")
-        if not key or not value:
+        key, sep, value = data.partition("=")
+        if not sep or not key or not value:
             raise ValueError(
                 f"Invalid jinja parse data: {data}. Must be in the form 'key=value'"
             )
@@ -143,14 +161,13 @@ def main():
             return
 
     print(f"Running apps: {', '.join(apps)}")
-    tl = get_version(input_files)
+    expanded = expand_input_files(input_files)
+    tl = get_version(expanded)
 
-    if tl is None or any(
-        os.path.basename(f) == "parsed-processed-input.yaml" for f in input_files
-    ):
+    if tl is None or any(os.path.basename(f) == PARSED_INPUT_NAME for f in expanded):
         import timeloopfe.v4 as tl
 
-        call_no_parse(apps, args, tl)
+        call_no_parse(apps, args, tl, expanded)
         return
 
     spec = tl.Specification.from_yaml_files(
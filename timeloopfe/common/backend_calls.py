@@ -5,6 +5,7 @@ import os
 import signal
 import subprocess
 import sys
+import threading
 from typing import Any, List, Optional, Dict, Tuple, Union
 import logging
 from accelergy.utils.yaml import to_yaml_string
@@ -58,6 +59,33 @@ def _specification_to_yaml_string(
     return input_content
 
 
+def _write_if_changed(path: str, content: str) -> bool:
+    """Write content to a file unless the file already holds that content.
+    Unchanged files are left alone so their mtimes are preserved.
+    !@param path The path of the file to write.
+    !@param content The content to write.
+    !@return True if the file was written, False if it was already up to date.
+    """
+    try:
+        with open(path, "r") as f:
+            if f.read() == content:
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    # Write to a temporary file and move it into place so that readers never
+    # see a partially-written file.
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return True
+
+
 def _pre_call(
     specification: BaseSpecification,
     output_dir: str,
@@ -75,11 +103,9 @@ def _pre_call(
     input_content = _specification_to_yaml_string(specification, for_model)
 
     os.makedirs(output_dir, exist_ok=True)
-    with open(
-        os.path.join(output_dir, "parsed-processed-input.yaml"),
-        "w",
-    ) as f:
-        f.write(input_content)
+    _write_if_changed(
+        os.path.join(output_dir, "parsed-processed-input.yaml"), input_content
+    )
 
     input_paths = [os.path.join(output_dir, "parsed-processed-input.yaml")] + (
         extra_input_files or []
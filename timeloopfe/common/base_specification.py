@@ -63,6 +63,7 @@ class BaseSpecification(DictNode):
 
     def __init__(self, *args, **kwargs):
         self._processor_attributes = {}
+        self._processor_index_cache = (0, {})
         Node.set_global_spec(self)
         self.spec = self
 
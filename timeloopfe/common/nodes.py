@@ -2,6 +2,7 @@
 
 from abc import ABC
 import copy
+import functools
 import glob
 import inspect
 import logging
@@ -270,6 +271,7 @@ class Node(ABC):
         get_tag(self): Get the tag of this node.
         _get_index2checker(self, key2elem): Get the index-to-checker mapping.
         items(self): Get an iterable of (key, value) or (index, value) pairs.
+        iter_child_nodes(self): Get an iterable of (key, value) pairs whose values are Nodes.
         combine_index(self, key, value): Combine the value at the given key with the given value.
         _parse_elem(self, key, check, value_override): Parse an element of the node.
     """
@@ -449,6 +451,13 @@ class Node(ABC):
             return super().items()  # type: ignore
         return enumerate(self)  # type: ignore
 
+    def iter_child_nodes(self) -> Iterable[Tuple[Union[str, int], "Node"]]:
+        """Get iterable of (key, value) or (index, value) pairs for the
+        children of this node that are themselves Nodes."""
+        for k, v in self.items():
+            if isinstance(v, Node):
+                yield k, v
+
     def combine_index(self, key: Union[str, int], value: T) -> T:
         """Combine the value at the given key with the given value.
 
@@ -632,9 +641,8 @@ class Node(ABC):
         applied_to.add(id(self))
         if self_first:
             rval = func(self)
-        for _, v in self.items():
-            if isinstance(v, Node):
-                v.recursive_apply(func, self_first, applied_to)
+        for _, v in self.iter_child_nodes():
+            v.recursive_apply(func, self_first, applied_to)
         if self_first:
             return rval
         return func(self)
@@ -1133,6 +1141,7 @@ class Node(ABC):
             self[index] = v
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def unique_class_name(cls):
         """Return a unique name for this class."""
         return ".".join(c.__name__ for c in cls.mro()[::-1])
@@ -1320,15 +1329,18 @@ class DictNode(Node, dict):
         key2file = {}
         extra_elems = []
         to_parse = []
+        seen_files = set()  # (st_dev, st_ino) of files already in to_parse
         for f in files:
             logging.info("Loading yaml file %s", f)
             globbed = [x for x in glob.glob(f) if os.path.isfile(x)]
             if not globbed:
                 raise FileNotFoundError(f"Could not find file {f}")
             for g in globbed:
-                if any(os.path.samefile(g, x) for x in to_parse):
+                st = os.stat(g)
+                if (st.st_dev, st.st_ino) in seen_files:
                     logging.info('Ignoring duplicate file "%s" in yaml load', g)
                 else:
+                    seen_files.add((st.st_dev, st.st_ino))
                     to_parse.append(g)
 
         for f in to_parse:
@@ -4,7 +4,7 @@ from abc import abstractmethod, ABC
 import copy
 import logging
 from .nodes import Node
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 
 class Processor(ABC):
@@ -18,6 +18,9 @@ class Processor(ABC):
     def __init__(self, spec: Optional["Specification"] = None):
         self._initialized: bool = True
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Per-class checker dicts in self.spec._processor_attributes
+        self._attr_buckets: Dict[type, dict] = {}
+        self._attr_buckets_spec: Optional["Specification"] = None
 
     def pre_parse_process(self, spec: "Specification"):
         """Process the specification before parsing."""
@@ -40,14 +43,24 @@ class Processor(ABC):
 
     def get_index(self, processor_type: type, spec: "Specification"):
         """Get the index of the processor in the list of processors."""
-        for i, processor in enumerate(spec._processors_run):
-            if isinstance(processor, type):
-                return i
-            if isinstance(processor, processor_type):
-                return i
-            if processor == processor_type:
-                return i
-        return -1
+        # _processors_run is append-only, so its length identifies the cache
+        n_run, cache = spec._processor_index_cache
+        if n_run != len(spec._processors_run):
+            cache = {}
+            spec._processor_index_cache = (len(spec._processors_run), cache)
+        if processor_type not in cache:
+            cache[processor_type] = -1
+            for i, processor in enumerate(spec._processors_run):
+                if isinstance(processor, type):
+                    cache[processor_type] = i
+                    break
+                if isinstance(processor, processor_type):
+                    cache[processor_type] = i
+                    break
+                if processor == processor_type:
+                    cache[processor_type] = i
+                    break
+        return cache[processor_type]
 
     def must_run_after(
         self, other: type, spec: "Specification", ok_if_not_found: bool = False
@@ -77,13 +90,20 @@ class Processor(ABC):
         if not issubclass(target, Node):
             raise TypeError(f"Can only add attributes to Node subclasses ")
 
+        if getattr(self, "_attr_buckets_spec", None) is not self.spec:
+            self._attr_buckets, self._attr_buckets_spec = {}, self.spec
+        bucket = self._attr_buckets.get(target)
+        if bucket is None:
+            bucket = self.spec._processor_attributes.setdefault(
+                target.unique_class_name(), {}
+            )
+            self._attr_buckets[target] = bucket
+
         target.add_attr(
             *args,
             **kwargs,
             _processor_responsible_for_removing=self,
-            _add_checker_to=self.spec._processor_attributes.setdefault(
-                target.unique_class_name(), {}
-            ),
+            _add_checker_to=bucket,
         )
 
 
@@ -109,9 +129,8 @@ class SimpleProcessor(Processor):
 
 
 def set_parents(n: Node):
-    for _, x in n.items():
-        if isinstance(x, Node):
-            x.parent_node = n
+    for _, x in n.iter_child_nodes():
+        x.parent_node = n
 
 
 class References2CopiesProcessor(Processor):
@@ -122,37 +141,41 @@ class References2CopiesProcessor(Processor):
 
     def process(self, spec: "BaseSpecification"):
         super().process(spec)
-        seen_ids = set()
-        visited = []
         processors = spec.processors  # Don't copy processors
         spec.processors = []
-        self.refs2copies_fast(spec, spec, seen_ids, visited)
+        self.refs2copies_fast(spec, spec)
         spec.processors = processors
 
-    def refs2copies_fast(
-        self, spec: "BaseSpecification", n: Any, seen_ids=None, visited=None, depth=0
-    ) -> Any:
-        visited.append(n)  # Avoid garbage collection
-        if isinstance(n, Node):
-            n.parent_node = None
-
-        if id(n) in seen_ids:
-            n = copy.deepcopy(n)
-        seen_ids.add(id(n))
-
-        if not isinstance(n, Node):
-            return n
-
-        if isinstance(n, Node):
-            for i, x in n.items():
-                # self.logger.debug(
-                #     "Depth %s Copying %s in %s[%s]", depth, str(x), str(n), i
-                # )  # type: ignore
-                n[i] = self.refs2copies_fast(spec, x, seen_ids, visited, depth + 1)
-                if isinstance(n[i], Node):
-                    n[i].parent_node = n
-                    n[i].spec = spec
-            n.parent_node = None
+    def refs2copies_fast(self, spec: "BaseSpecification", n: Any) -> Any:
+        """Replace every repeated reference under n with a deep copy.
+
+        The first occurrence of an object (in depth-first order) is kept and
+        each later occurrence is replaced with its own copy. Uses an explicit
+        stack so deep specifications don't hit the recursion limit.
+        """
+        # Everything seen stays referenced by the tree, so ids can't be reused
+        seen_ids = set()
+        stack = [(None, None, n)]
+        while stack:
+            parent, key, x = stack.pop()
+            if id(x) in seen_ids:
+                # Don't let deepcopy walk up through parent_node or into the
+                # spec that every node points to.
+                memo = {id(spec): spec}
+                if isinstance(x, Node):
+                    memo[id(x.parent_node)] = None
+                x = copy.deepcopy(x, memo)
+            seen_ids.add(id(x))
+
+            if parent is not None:
+                parent[key] = x
+            if not isinstance(x, Node):
+                continue
+            x.parent_node = parent
+            if parent is not None:
+                x.spec = spec
+            # Reversed so children are visited in order, as in a recursive walk
+            stack.extend((x, i, v) for i, v in reversed(list(x.items())))
         return n
 
 
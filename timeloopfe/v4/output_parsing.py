@@ -15,7 +15,8 @@ def parse_stats_file(path: str) -> Tuple[int, int, float, dict]:
         Tuple[int, int, float, dict]: The cycles, computes, percent utilization, and energy.
 
     """
-    lines = open(path, "r").readlines()
+    with open(path, "r") as f:
+        lines = f.read().splitlines()
     cycles, computes, util, energy = None, None, None, {}
     for i, l in enumerate(lines):
         if "Computes =" in l:
@@ -51,7 +52,8 @@ def get_area_from_art(path: str) -> dict:
         dict: The area of each component.
 
     """
-    d = yaml.load(open(path, "r").read(), Loader=yaml.SafeLoader)
+    with open(path, "r") as f:
+        d = yaml.load(f, Loader=yaml.SafeLoader)
     name2area = {}
     for x in d["ART"]["tables"]:
         namecount = x["name"].split(".", 1)[1]
@@ -422,8 +424,10 @@ def parse_timeloop_output(
 
     spec.parse_expressions()
     mapping = None
-    if os.path.exists(stats_path.replace(".stats.txt", ".map.txt")):
-        mapping = open(stats_path.replace(".stats.txt", ".map.txt")).read()
+    mapping_path = stats_path.replace(".stats.txt", ".map.txt")
+    if os.path.exists(mapping_path):
+        with open(mapping_path, "r") as f:
+            mapping = f.read()
 
     try:
         cycle_seconds = spec.variables["GLOBAL_CYCLE_SECONDS"]